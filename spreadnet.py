@@ -9,11 +9,28 @@ Educational and research purposes only.
 import asyncio
 import aiohttp
 import json
+import ssl
 import time
-from datetime import datetime
+import numpy as np
 from typing import Dict, List, Optional
 import logging
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +39,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _scan_spreads(quotes, fee):
+    """
+    Pairwise spread/profit matrices (row = buy DEX, column = sell DEX)
+    The diagonal is masked so same-DEX pairs never qualify
+    """
+    # In-place updates keep this at two allocations instead of one
+    # temporary per arithmetic step
+    spreads = quotes[None, :] / quotes[:, None]
+    spreads -= 1.0
+    spreads *= 100.0
+    profits = np.abs(spreads)
+    profits -= fee
+    np.fill_diagonal(profits, -np.inf)
+    return spreads, profits
+
+if njit is not None:
+    # Numba compiles the explicit loops to machine code, beating the
+    # broadcast version once the DEX count grows. The explicit signature
+    # compiles eagerly at import time rather than on the first cycle, and
+    # cache=True persists the compiled kernel to disk across runs
+    @njit('UniTuple(float64[:, :], 2)(float64[:], float64)', cache=True)
+    def _scan_spreads(quotes, fee):
+        n = quotes.shape[0]
+        spreads = np.empty((n, n))
+        profits = np.empty((n, n))
+        for i in range(n):
+            for j in range(n):
+                spread = (quotes[j] - quotes[i]) / quotes[i] * 100.0
+                spreads[i, j] = spread
+                profits[i, j] = abs(spread) - fee if i != j else -np.inf
+        return spreads, profits
+
 class SolanaArbitrageDetector:
     """
     Advanced Solana arbitrage detection engine
@@ -30,6 +79,9 @@ class SolanaArbitrageDetector:
     
     def __init__(self):
         self.session = None
+        # One verified SSL context shared by every connection; building a
+        # context is expensive (CA bundle load) and only needs to happen once
+        self.ssl_context = ssl.create_default_context()
         self.opportunities_found = 0
         self.total_profit = 0.0
         self.best_profit = 0.0
@@ -49,10 +101,39 @@ class SolanaArbitrageDetector:
         
         # Minimum profit threshold (in %)
         self.min_profit_threshold = 0.1  # 0.1% minimum
+
+        # Round-trip fee estimate (in %): 0.3% per leg, buy + sell
+        self.round_trip_fee = 0.6
+
+        # Short-lived price cache: {source: (fetched_at, data)}
+        # Avoids hammering DEX APIs if cycles run faster than prices move
+        self.price_ttl = 1.5  # seconds
+        self._price_cache: Dict[str, tuple] = {}
+
+        # Timestamp string cache - strftime only runs when the second rolls over
+        self._ts_second = -1
+        self._ts_string = ''
         
+    @property
+    def avg_profit(self) -> float:
+        """Average profit across this session's opportunities"""
+        if self.opportunities_found == 0:
+            return 0.0
+        return self.total_profit / self.opportunities_found
+
     async def initialize(self):
         """Initialize HTTP session and connections"""
+        # Single pooled session for the whole run: keep-alive connections
+        # amortize TCP/TLS handshakes across detection cycles
+        connector = aiohttp.TCPConnector(
+            ssl=self.ssl_context,
+            limit=20,
+            limit_per_host=10,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=10),
             headers={'User-Agent': 'SpreadNet/1.0'}
         )
@@ -63,8 +144,27 @@ class SolanaArbitrageDetector:
         if self.session:
             await self.session.close()
             
+    def _timestamp(self) -> str:
+        """Wall-clock HH:MM:SS string, cached at one-second resolution"""
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_string = time.strftime('%H:%M:%S', time.localtime(now))
+        return self._ts_string
+
+    def _get_cached_prices(self, source: str) -> Optional[Dict]:
+        """Return cached price data for a source if still fresh"""
+        cached = self._price_cache.get(source)
+        if cached and time.monotonic() - cached[0] < self.price_ttl:
+            return cached[1]
+        return None
+
     async def fetch_jupiter_prices(self) -> Dict:
         """Fetch prices from Jupiter aggregator"""
+        cached = self._get_cached_prices('jupiter')
+        if cached is not None:
+            return cached
+
         try:
             params = {
                 'ids': 'So11111111111111111111111111111111111111112,4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R',
@@ -73,8 +173,10 @@ class SolanaArbitrageDetector:
             
             async with self.session.get(self.dex_configs['jupiter']['url'], params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return data.get('data', {})
+                    data = await response.json(loads=_json_loads)
+                    prices = data.get('data', {})
+                    self._price_cache['jupiter'] = (time.monotonic(), prices)
+                    return prices
                 else:
                     logger.warning(f"Jupiter API returned status {response.status}")
                     return {}
@@ -85,10 +187,15 @@ class SolanaArbitrageDetector:
     
     async def fetch_raydium_prices(self) -> Dict:
         """Fetch prices from Raydium"""
+        cached = self._get_cached_prices('raydium')
+        if cached is not None:
+            return cached
+
         try:
             async with self.session.get(self.dex_configs['raydium']['url']) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=_json_loads)
+                    self._price_cache['raydium'] = (time.monotonic(), data)
                     return data
                 else:
                     logger.warning(f"Raydium API returned status {response.status}")
@@ -104,47 +211,51 @@ class SolanaArbitrageDetector:
         Returns list of profitable opportunities
         """
         opportunities = []
-        
+
         # Example calculation for SOL/USDC
         if 'SOL' in prices:
             sol_prices = prices['SOL']
-            
-            # Find price differences between DEXs
-            for dex1, price1 in sol_prices.items():
-                for dex2, price2 in sol_prices.items():
-                    if dex1 != dex2 and price1 and price2:
-                        try:
-                            price1_float = float(price1)
-                            price2_float = float(price2)
-                            
-                            if price1_float > 0 and price2_float > 0:
-                                spread = ((price2_float - price1_float) / price1_float) * 100
-                                
-                                # Estimate profit after fees (assuming 0.3% total fees)
-                                estimated_profit = abs(spread) - 0.6  # 0.6% for buy/sell fees
-                                
-                                if estimated_profit > self.min_profit_threshold:
-                                    opportunity = {
-                                        'pair': 'SOL/USDC',
-                                        'buy_dex': dex1,
-                                        'sell_dex': dex2,
-                                        'buy_price': price1_float,
-                                        'sell_price': price2_float,
-                                        'spread_percent': round(spread, 2),
-                                        'estimated_profit': round(estimated_profit, 2),
-                                        'timestamp': datetime.now().strftime('%H:%M:%S')
-                                    }
-                                    opportunities.append(opportunity)
-                                    
-                        except (ValueError, TypeError):
-                            continue
-                            
+
+            # Collect valid numeric quotes, keeping DEX order stable
+            dex_names = []
+            quotes = []
+            for dex, price in sol_prices.items():
+                try:
+                    price_float = float(price)
+                except (ValueError, TypeError):
+                    continue
+                if price_float > 0:
+                    dex_names.append(dex)
+                    quotes.append(price_float)
+
+            if len(quotes) < 2:
+                return opportunities
+
+            # Estimate profit after fees
+            quote_arr = np.array(quotes)
+            spreads, profits = _scan_spreads(quote_arr, self.round_trip_fee)
+
+            # Scalar Python work only remains for the profitable pairs
+            timestamp = self._timestamp()
+            for i, j in zip(*np.nonzero(profits > self.min_profit_threshold)):
+                opportunity = {
+                    'pair': 'SOL/USDC',
+                    'buy_dex': dex_names[i],
+                    'sell_dex': dex_names[j],
+                    'buy_price': quotes[i],
+                    'sell_price': quotes[j],
+                    'spread_percent': round(spreads[i, j].item(), 2),
+                    'estimated_profit': round(profits[i, j].item(), 2),
+                    'timestamp': timestamp
+                }
+                opportunities.append(opportunity)
+
         return opportunities
     
-    def display_opportunity(self, opp: Dict):
-        """Display an arbitrage opportunity in terminal format"""
+    def format_opportunity(self, opp: Dict) -> str:
+        """Format an arbitrage opportunity as a terminal line"""
         profit_bps = int(opp['estimated_profit'] * 100)  # Convert to basis points
-        
+
         # Color coding based on profit
         if opp['estimated_profit'] > 1.0:
             color = '\033[92m'  # Green
@@ -153,19 +264,22 @@ class SolanaArbitrageDetector:
         else:
             color = '\033[91m'  # Red
         reset = '\033[0m'
-        
-        print(f"{color}[{opp['timestamp']}] {opp['pair']} | "
-              f"{opp['buy_dex']}@{opp['buy_price']:.6f} → "
-              f"{opp['sell_dex']}@{opp['sell_price']:.6f} | "
-              f"spread {opp['spread_percent']:+.2f}% | "
-              f"profit {opp['estimated_profit']:.2f}% ({profit_bps}bps){reset}")
+
+        return (f"{color}[{opp['timestamp']}] {opp['pair']} | "
+                f"{opp['buy_dex']}@{opp['buy_price']:.6f} → "
+                f"{opp['sell_dex']}@{opp['sell_price']:.6f} | "
+                f"spread {opp['spread_percent']:+.2f}% | "
+                f"profit {opp['estimated_profit']:.2f}% ({profit_bps}bps){reset}")
     
     async def detect_arbitrage_cycle(self):
         """Single cycle of arbitrage detection"""
         try:
-            # Fetch prices from multiple sources
-            jupiter_data = await self.fetch_jupiter_prices()
-            raydium_data = await self.fetch_raydium_prices()
+            # Fetch prices from all sources concurrently - cycle latency is
+            # the slowest API's RTT instead of the sum of all of them
+            jupiter_data, raydium_data = await asyncio.gather(
+                self.fetch_jupiter_prices(),
+                self.fetch_raydium_prices()
+            )
             
             # Combine price data (simplified example)
             combined_prices = {
@@ -178,20 +292,23 @@ class SolanaArbitrageDetector:
             # Calculate arbitrage opportunities
             opportunities = self.calculate_arbitrage(combined_prices)
             
-            # Display new opportunities
+            # Display new opportunities as one write per cycle
+            lines = []
             for opp in opportunities:
-                self.display_opportunity(opp)
+                lines.append(self.format_opportunity(opp))
                 self.opportunities_found += 1
                 self.total_profit += opp['estimated_profit']
-                
+
                 if opp['estimated_profit'] > self.best_profit:
                     self.best_profit = opp['estimated_profit']
+
+            if lines:
+                print('\n'.join(lines))
             
             # Display stats every 60 seconds
             if self.opportunities_found > 0 and self.opportunities_found % 20 == 0:
-                avg_profit = self.total_profit / self.opportunities_found
                 print(f"\n📊 Stats: {self.opportunities_found} opportunities | "
-                      f"Avg: {avg_profit:.2f}% | Best: {self.best_profit:.2f}%\n")
+                      f"Avg: {self.avg_profit:.2f}% | Best: {self.best_profit:.2f}%\n")
                 
         except Exception as e:
             logger.error(f"Error in arbitrage detection cycle: {e}")
@@ -221,15 +338,17 @@ class SolanaArbitrageDetector:
             print(f"\n📈 Session Summary:")
             print(f"Total opportunities found: {self.opportunities_found}")
             if self.opportunities_found > 0:
-                avg_profit = self.total_profit / self.opportunities_found
-                print(f"Average profit: {avg_profit:.2f}%")
+                print(f"Average profit: {self.avg_profit:.2f}%")
                 print(f"Best opportunity: {self.best_profit:.2f}%")
             print("\nThank you for using SpreadNet! 🚀")
 
 def main():
     """Main entry point"""
+    if uvloop is not None:
+        uvloop.install()
+
     detector = SolanaArbitrageDetector()
-    
+
     try:
         asyncio.run(detector.run())
     except Exception as e: